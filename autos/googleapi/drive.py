@@ -26,6 +26,36 @@ logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 15
 
+RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+
+SLEEP_SECONDS = tuple(2 ** i for i in range(MAX_RETRIES))
+
+MIN_CHUNKSIZE = 256 * 1024
+
+MAX_CHUNKSIZE = 4 * 1024 * 1024
+
+
+def adaptive_chunksize(src):
+    """Picks an upload chunk size proportional to the source file size.
+
+    Small files get the smallest chunk size the API allows so they upload
+    in a single request, while large files are capped at MAX_CHUNKSIZE so
+    a retry only resends one chunk. Chunk sizes must be a multiple of 256KB.
+
+    :type src: string
+    :param src: Source file path.
+
+    :rtype: int
+    :returns: Chunk size in bytes.
+    """
+
+    try:
+        size = os.path.getsize(src)
+    except OSError:
+        return MAX_CHUNKSIZE
+    n_chunks = -(-size // MIN_CHUNKSIZE) or 1
+    return min(MAX_CHUNKSIZE, n_chunks * MIN_CHUNKSIZE)
+
 
 def incremental_download(fp, request):
     downloader = MediaIoBaseDownload(fp, request)
@@ -36,8 +66,8 @@ def incremental_download(fp, request):
         try:
             _, done = next_chunk()
         except HttpError as e:
-            if e.resp.status in (500, 502, 503, 504) and num_retries < MAX_RETRIES - 1:
-                time.sleep(2 ** num_retries)
+            if e.resp.status in RETRYABLE_STATUSES and num_retries < MAX_RETRIES - 1:
+                time.sleep(SLEEP_SECONDS[num_retries])
                 num_retries += 1
                 continue
             else:
@@ -75,7 +105,7 @@ class Drive(Service):
             logger.exception('CREATE_FOLDER_ERROR')
             raise CreateFolderError from e
 
-    def upload(self, src, name=None, parents=(), mime_type=None, resumable=True, chunksize=4*1024*1024):
+    def upload(self, src, name=None, parents=(), mime_type=None, resumable=True, chunksize=None):
         """Uploads a file to Google Drive and convert it to a Google document.
 
         Google Drive documentations:
@@ -99,15 +129,18 @@ class Drive(Service):
 
         :type chunksize: int
         :param chunksize: File will be uploaded in chunks of this many bytes. Only
-                          used if resumable=True. Pass in a value of -1 if the file is to be
-                          uploaded in a single chunk. Note that Google App Engine has a 5MB limit
-                          on request size, so you should never set your chunksize larger than 5MB,
-                          or to -1.
+                          used if resumable=True. Defaults to a size adapted to the
+                          source file size, between MIN_CHUNKSIZE and MAX_CHUNKSIZE.
+                          Note that Google App Engine has a 5MB limit on request size,
+                          so you should never set your chunksize larger than 5MB.
 
         :rtype: string
         :returns: Uploaded file ID.
         """
 
+        if chunksize is None:
+            chunksize = adaptive_chunksize(src)
+
         filename = os.path.split(src)[1]
         name = name or filename
         metadata = {
@@ -206,9 +239,8 @@ class Drive(Service):
     def export_as(self, file_id, dest, mime_type):
         """Exports a Google docs file.
 
-        Can't use apiclient.http.MediaIoBaseDownload when exporting a Google docs
-        file because of infinite loop bug. See:
-        https://github.com/google/google-api-python-client/issues/15
+        The export media is streamed to dest chunk by chunk, like download(),
+        so memory use stays constant regardless of the exported file size.
 
         :type file_id: string
         :param file_id: Google Doc file ID.
@@ -217,18 +249,18 @@ class Drive(Service):
         :param dest: Destination file path.
         """
 
+        request = self.service.files().export_media(
+            fileId=file_id,
+            mimeType=mime_type,
+        )
+
         try:
-            content = self.service.files().export_media(
-                fileId=file_id,
-                mimeType=mime_type,
-            ).execute()
-        except HttpError as e:
+            with open(dest, 'wb') as fp:
+                incremental_download(fp, request)
+        except DownloadError as e:
             logger.exception('EXPORT_ERROR')
             raise ExportError from e
 
-        with open(dest, 'wb') as fp:
-            fp.write(content)
-
     def export_gsheet_as_csv(self, file_id, dest):
         """Exports a Google Sheet (first sheet only) as CSV file.
 
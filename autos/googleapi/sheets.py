@@ -1,6 +1,6 @@
 import time
-import uuid
 import logging
+import secrets
 import functools
 
 from autos.utils.csv import write_csv
@@ -84,7 +84,8 @@ class Sheets(Service):
         """Refreshes sheets' properties."""
 
         sheets = self.metadata.get('sheets', [])
-        self._properties = {sheet['properties']['title']: sheet['properties'] for sheet in sheets}
+        properties = (sheet['properties'] for sheet in sheets)
+        self._properties = {props['title']: props for props in properties}
 
     def get_sheet_id(self, sheet_name):
         """Maps sheet name to its id."""
@@ -193,7 +194,7 @@ class Sheets(Service):
         numbers of rows and columns.
         """
 
-        sheet_temp_name = uuid.uuid4().hex
+        sheet_temp_name = secrets.token_hex(16)
         self.batch_update(
             self.add(sheet_temp_name, row_count=row_count, column_count=column_count, batch=True),
             *(self.delete_by_name(title, batch=True) for title in self.properties),
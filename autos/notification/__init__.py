@@ -1 +1,2 @@
+from .email import Mailer
 from .email import send_email
@@ -1,7 +1,6 @@
 import os
 import base64
 import smtplib
-from email import encoders
 from email.utils import COMMASPACE
 from email.utils import formatdate
 from email.mime.base import MIMEBase
@@ -9,6 +8,97 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 
+ATTACHMENT_BUFSIZE = 57 * 1024
+
+
+def validate_attachments(paths):
+    """Checks that every attachment path points to an existing file.
+
+    Paths are grouped by directory and each directory is listed once with
+    os.scandir, so validating N attachments from the same directory costs
+    one directory read instead of N stat calls.
+
+    :type paths: list
+    :param paths: File attachment paths.
+    """
+
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path) or '.', []).append(path)
+
+    for dirname, group in by_dir.items():
+        try:
+            with os.scandir(dirname) as entries:
+                existing = {entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            existing = set()
+        for path in group:
+            if os.path.basename(path) not in existing:
+                raise FileNotFoundError(path)
+
+
+def make_message(
+    send_from,
+    send_to,
+    subject,
+    text,
+    paths=[],
+    use_html=True,
+):
+    """Build an e-mail message with or without attachment(s).
+
+    :type send_from: string
+    :param send_from: Sender e-mail address.
+
+    :type send_to: list
+    :param send_to: List of recipient e-mail addresses.
+
+    :type subject: string
+    :param subject: E-mail subject.
+
+    :type text: string
+    :param text: E-mail text content.
+
+    :type paths: list
+    :param paths: File attachment paths.
+
+    :type use_html: bool
+    :param use_html: If true, text is interpreted as HTML (default), otherwise plaintext.
+
+    :rtype: MIMEMultipart
+    :returns: The assembled message.
+    """
+
+    message = MIMEMultipart()
+    message['From'] = send_from
+    message['To'] = COMMASPACE.join(send_to)
+    message['Date'] = formatdate(localtime=True)
+    message['Subject'] = subject
+
+    subtype = 'html' if use_html else 'plain'
+    message.attach(MIMEText(text, subtype, 'utf-8'))
+
+    validate_attachments(paths)
+
+    for path in paths:
+        part = MIMEBase('application', "octet-stream")
+        encoded = []
+        with open(path, 'rb') as fp:
+            # A multiple of 57 bytes encodes to whole 76-char base64 lines,
+            # so chunked output is identical to encoding the file at once.
+            for block in iter(lambda: fp.read(ATTACHMENT_BUFSIZE), b''):
+                encoded.append(base64.encodebytes(block).decode('ascii'))
+        part.set_payload(''.join(encoded))
+        part['Content-Transfer-Encoding'] = 'base64'
+        part.add_header(
+            'Content-Disposition',
+            'attachment; filename="{}"'.format(os.path.basename(path))
+        )
+        message.attach(part)
+
+    return message
+
+
 def send_email(
     send_from,
     send_to,
@@ -61,32 +151,94 @@ def send_email(
     if isinstance(send_to, str):
         send_to = [send_to]
 
-    message = MIMEMultipart()
-    message['From'] = send_from
-    message['To'] = COMMASPACE.join(send_to)
-    message['Date'] = formatdate(localtime=True)
-    message['Subject'] = subject
-
-    subtype = 'html' if use_html else 'plain'
-    message.attach(MIMEText(text, subtype, 'utf-8'))
-
-    for path in paths:
-        if not os.path.isfile(path):
-            raise FileNotFoundError(path)
-
-        part = MIMEBase('application', "octet-stream")
-        with open(path, 'rb') as fp:
-            part.set_payload(fp.read())
-
-        encoders.encode_base64(part)
-        part.add_header(
-            'Content-Disposition',
-            'attachment; filename="{}"'.format(os.path.basename(path))
-        )
-        message.attach(part)
+    message = make_message(
+        send_from=send_from,
+        send_to=send_to,
+        subject=subject,
+        text=text,
+        paths=paths,
+        use_html=use_html,
+    )
 
     with smtplib.SMTP(server, port) as smtp:
         if use_tls:
             smtp.starttls()
         smtp.login(username,password)
         smtp.sendmail(send_from, send_to, msg=message.as_string())
+
+
+class Mailer:
+    """Sends e-mails over a single reusable SMTP session.
+
+    send_email() opens, authenticates, and closes a connection per call;
+    when many e-mails are sent in one run the TLS handshake and login
+    dominate. Mailer keeps the connection open between sends:
+
+        with Mailer(username=user, password=pwd) as mailer:
+            for report in reports:
+                mailer.send(...)
+    """
+
+    def __init__(
+        self,
+        server="smtp.gmail.com",
+        port=587,
+        username='',
+        password='',
+        use_tls=True,
+    ):
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self._smtp = None
+
+    def __enter__(self):
+        return self.connect()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def connect(self):
+        """Opens and authenticates the SMTP session."""
+
+        self._smtp = smtplib.SMTP(self.server, self.port)
+        if self.use_tls:
+            self._smtp.starttls()
+        self._smtp.login(self.username, self.password)
+        return self
+
+    def close(self):
+        """Closes the SMTP session."""
+
+        if self._smtp is not None:
+            self._smtp.quit()
+            self._smtp = None
+
+    def send(
+        self,
+        send_from,
+        send_to,
+        subject,
+        text,
+        paths=[],
+        use_html=True,
+    ):
+        """Sends one e-mail over the open session.
+
+        Accepts the same message arguments as send_email().
+        """
+
+        if isinstance(send_to, str):
+            send_to = [send_to]
+
+        message = make_message(
+            send_from=send_from,
+            send_to=send_to,
+            subject=subject,
+            text=text,
+            paths=paths,
+            use_html=use_html,
+        )
+        return self._smtp.sendmail(send_from, send_to, msg=message.as_string())
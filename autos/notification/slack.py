@@ -1,17 +1,12 @@
-import json
-import urllib.request
+import requests
 
 
 class IncomingWebhook:
     def __init__(self, url):
         self.url = url
-        self.headers = {'content-type': 'application/json'}
+        self.session = requests.Session()
 
     def send(self, **payload):
-        data = json.dumps(payload).encode('UTF-8')
-        request = urllib.request.Request(
-            url=self.url,
-            data=data,
-            headers=self.headers,
-        )
-        return urllib.request.urlopen(request)
+        response = self.session.post(self.url, json=payload)
+        response.raise_for_status()
+        return response
@@ -1,5 +1,6 @@
 import logging
 import unittest
+import contextlib
 import unittest.mock as mock
 
 
@@ -13,13 +14,13 @@ logging.getLogger('autos.googleapi.drive').setLevel(logging.CRITICAL)
 
 class TestIncrementalDownload(unittest.TestCase):
     def setUp(self):
-        patcher = mock.patch.object(drive.time, 'sleep')
-        self.addCleanup(patcher.stop)
-        self.mock_sleep = patcher.start()
+        stack = contextlib.ExitStack()
+        self.addCleanup(stack.close)
 
-        patcher = mock.patch.object(drive, 'MediaIoBaseDownload')
-        self.addCleanup(patcher.stop)
-        self.mockMediaIoBaseDownload = patcher.start()
+        self.mock_sleep = stack.enter_context(mock.patch.object(drive.time, 'sleep'))
+        self.mockMediaIoBaseDownload = stack.enter_context(
+            mock.patch.object(drive, 'MediaIoBaseDownload')
+        )
 
         self.mock_next_chunk = self.mockMediaIoBaseDownload.return_value.next_chunk
         self.mock_fp = mock.MagicMock()
@@ -97,17 +98,12 @@ class TestDrive(unittest.TestCase):
     def setUp(self):
         self.drive = drive.Drive()
 
-        patcher = mock.patch.object(drive.Drive, 'service')
-        self.addCleanup(patcher.stop)
-        self.drive.service = patcher.start()
-
-        patcher = mock.patch.object(drive, 'MediaFileUpload')
-        self.addCleanup(patcher.stop)
-        self.mockMediaFileUpload = patcher.start()
+        stack = contextlib.ExitStack()
+        self.addCleanup(stack.close)
 
-        patcher = mock.patch('builtins.open')
-        self.addCleanup(patcher.stop)
-        self.mock_open = patcher.start()
+        self.drive.service = stack.enter_context(mock.patch.object(drive.Drive, 'service'))
+        self.mockMediaFileUpload = stack.enter_context(mock.patch.object(drive, 'MediaFileUpload'))
+        self.mock_open = stack.enter_context(mock.patch('builtins.open'))
         self.mock_fp = self.mock_open.return_value.__enter__.return_value
 
     def test_api_name_is_correct(self):
@@ -217,7 +213,8 @@ class TestDrive(unittest.TestCase):
             mock_request,
         )
 
-    def test_export_as_passes_correct_argument_to_export_media(self):
+    @mock.patch.object(drive, 'incremental_download')
+    def test_export_as_passes_correct_argument_to_export_media(self, mock_incremental_download):
         self.drive.export_as(file_id='your_file_id', dest='here', mime_type='mime_type')
         self.drive \
             .service \
@@ -228,39 +225,22 @@ class TestDrive(unittest.TestCase):
                  mimeType='mime_type',
              )
 
-    def test_export_as_calls_execute_after_export_media(self):
+    @mock.patch.object(drive, 'incremental_download')
+    def test_export_as_streams_media_to_file(self, mock_incremental_download):
+        mock_request = self.drive.service.files().export_media.return_value
         self.drive.export_as(file_id='your_file_id', dest='here', mime_type='mime_type')
-        self.drive \
-            .service \
-            .files() \
-            .export_media \
-            .return_value \
-            .execute \
-            .assert_called_once_with()
+        self.mock_open.assert_called_once_with('here', 'wb')
+        mock_incremental_download.assert_called_once_with(
+            self.mock_fp,
+            mock_request,
+        )
 
-    def test_export_as_on_http_error_raises_upload_error(self):
-        self.drive \
-            .service \
-            .files() \
-            .export_media \
-            .return_value \
-            .execute \
-            .side_effect = errors.HttpError(resp=mock.MagicMock(), content=b'')
+    @mock.patch.object(drive, 'incremental_download')
+    def test_export_as_on_download_error_raises_export_error(self, mock_incremental_download):
+        mock_incremental_download.side_effect = errors.DownloadError
         with self.assertRaises(errors.ExportError):
             self.drive.export_as(file_id='your_file_id', dest='here', mime_type='mime_type')
 
-    def test_export_as_writes_content_to_file(self):
-        self.drive \
-            .service \
-            .files() \
-            .export_media \
-            .return_value \
-            .execute \
-            .return_value = b'this_is_content'
-        self.drive.export_as(file_id='your_file_id', dest='here', mime_type='mime_type')
-        self.mock_open.assert_called_once_with('here', 'wb')
-        self.mock_fp.write.assert_called_once_with(b'this_is_content')
-
     @mock.patch.object(drive.Drive, 'export_as')
     def test_export_gsheet_as_csv(self, mock_export_as):
         self.drive.export_gsheet_as_csv('file_id', dest='dest_file_path')
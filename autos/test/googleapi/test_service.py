@@ -1,4 +1,5 @@
 import unittest
+import contextlib
 import unittest.mock as mock
 
 import autos.googleapi.errors as errors
@@ -22,59 +23,89 @@ class TestService(unittest.TestCase):
         self.service._service = service_obj
         self.assertEqual(service_obj, self.service.service)
 
-    @mock.patch.object(service, 'Storage')
-    def test_returns_credentials_when_exists(self, mockStorage):
-        mock_credentials = mock.MagicMock()
-        mock_credentials.invalid = False
-        mockStorage.return_value.get.return_value = mock_credentials
-        credentials = self.service._get_credentials(credentials_file='', client_secrets_file='')
-        self.assertEqual(mock_credentials, credentials)
-
-    @mock.patch.multiple(
-        service,
-        Storage=mock.DEFAULT,
-        flow_from_clientsecrets=mock.DEFAULT,
-        tools=mock.DEFAULT,
-        autospec=True,
-    )
-    def test_run_flow_process_when_credentials_is_none(self, **mocks):
-        mocks['Storage'].return_value.get.return_value.invalid = True
-        mock_credentials = mock.MagicMock()
-        mocks['tools'].run_flow.return_value = mock_credentials
-        credentials = self.service._get_credentials(
-            credentials_file='credentials_file',
-            client_secrets_file='client_secrets_file',
-        )
-        mocks['flow_from_clientsecrets'].assert_called_once_with('client_secrets_file', scope='scope')
-        mocks['tools'].run_flow.assert_called_once_with(
-            mocks['flow_from_clientsecrets'].return_value,
-            mocks['Storage'].return_value,
-            mocks['tools'].argparser.parse_args.return_value,
-        )
-        mocks['tools'].argparser.parse_args.assert_called_once_with([]),
-        self.assertEqual(mock_credentials, credentials)
-
     @mock.patch.object(service.Service, '_get_credentials')
     @mock.patch.object(service, 'build')
-    @mock.patch.object(service, 'httplib2')
-    def test_init_service(self, mock_httplib2, mock_build, mock__get_credentials):
-        mockHttp = mock_httplib2.Http()
-        mock_credentials = mock.MagicMock()
-        self.service._get_credentials.return_value = mock_credentials
-        self.service.init_service(
+    def test_init_service(self, mock_build, mock__get_credentials):
+        retval = self.service.init_service(
             credentials_file='credentials_file',
             client_secrets_file='client_secrets_file',
+            api_key='api_key',
         )
-        self.service._get_credentials.assert_called_once_with(
+        mock__get_credentials.assert_called_once_with(
             'credentials_file',
             'client_secrets_file',
         )
-        mock_credentials.authorize.assert_called_once_with(mockHttp)
         mock_build.assert_called_once_with(
             'api_name',
             'api_version',
-            http=mock_credentials.authorize.return_value
+            credentials=mock__get_credentials.return_value,
+            developerKey='api_key',
+        )
+        self.assertEqual(retval, self.service)
+        self.assertEqual(self.service.service, mock_build.return_value)
+
+
+class TestGetCredentials(unittest.TestCase):
+    """The credential-flow tests share one set of setUp patchers over the
+    handful of names _get_credentials touches, rather than re-patching
+    whole modules with autospec inside each test.
+    """
+
+    def setUp(self):
+        self.service = service.Service(
+            scopes=['scope'],
+            api_name='api_name',
+            api_version='api_version',
         )
 
+        stack = contextlib.ExitStack()
+        self.addCleanup(stack.close)
 
+        self.mock_exists = stack.enter_context(mock.patch.object(service.os.path, 'exists'))
+        self.mock_open = stack.enter_context(mock.patch('builtins.open'))
+        self.mock_fp = self.mock_open.return_value.__enter__.return_value
+        self.mock_pickle = stack.enter_context(mock.patch.object(service, 'pickle'))
+        self.mockInstalledAppFlow = stack.enter_context(mock.patch.object(service, 'InstalledAppFlow'))
+        self.mockRequest = stack.enter_context(mock.patch.object(service, 'Request'))
 
+    def test_returns_cached_credentials_when_valid(self):
+        self.mock_exists.return_value = True
+        mock_credentials = mock.MagicMock()
+        mock_credentials.valid = True
+        self.mock_pickle.load.return_value = mock_credentials
+        credentials = self.service._get_credentials(
+            credentials_file='credentials_file',
+            client_secrets_file='client_secrets_file',
+        )
+        self.assertEqual(credentials, mock_credentials)
+        self.assertFalse(self.mockInstalledAppFlow.from_client_secrets_file.called)
+
+    def test_refreshes_expired_credentials(self):
+        self.mock_exists.return_value = True
+        mock_credentials = mock.MagicMock()
+        mock_credentials.valid = False
+        mock_credentials.expired = True
+        mock_credentials.refresh_token = 'refresh_token'
+        self.mock_pickle.load.return_value = mock_credentials
+        credentials = self.service._get_credentials(
+            credentials_file='credentials_file',
+            client_secrets_file='client_secrets_file',
+        )
+        mock_credentials.refresh.assert_called_once_with(self.mockRequest.return_value)
+        self.mock_pickle.dump.assert_called_once_with(mock_credentials, self.mock_fp)
+        self.assertEqual(credentials, mock_credentials)
+
+    def test_runs_flow_when_no_cached_credentials(self):
+        self.mock_exists.return_value = False
+        mock_flow = self.mockInstalledAppFlow.from_client_secrets_file.return_value
+        credentials = self.service._get_credentials(
+            credentials_file='credentials_file',
+            client_secrets_file='client_secrets_file',
+        )
+        self.mockInstalledAppFlow.from_client_secrets_file.assert_called_once_with(
+            'client_secrets_file',
+            ['scope'],
+        )
+        mock_flow.run_local_server.assert_called_once_with(port=0)
+        self.assertEqual(credentials, mock_flow.run_local_server.return_value)
+        self.mock_pickle.dump.assert_called_once_with(credentials, self.mock_fp)
@@ -1,4 +1,5 @@
 import unittest
+import contextlib
 import unittest.mock as mock
 
 import autos.notification.email as email
@@ -6,13 +7,17 @@ import autos.notification.email as email
 
 class TestSendEmail(unittest.TestCase):
     def setUp(self):
-        patcher = mock.patch.object(email, 'smtplib', autospec=True)
-        self.addCleanup(patcher.stop)
-        self.mock_smtplib = patcher.start()
+        stack = contextlib.ExitStack()
+        self.addCleanup(stack.close)
 
-        patcher = mock.patch.object(email, 'MIMEMultipart', autospec=True)
-        self.addCleanup(patcher.stop)
-        self.mock_MIMEMultipart = patcher.start()
+        # Mock only the surface send code touches; autospec'ing the whole
+        # smtplib module walks every class signature on each test.
+        self.mock_smtplib = stack.enter_context(
+            mock.patch.object(email, 'smtplib', mock.MagicMock(spec_set=['SMTP']))
+        )
+        self.mock_MIMEMultipart = stack.enter_context(
+            mock.patch.object(email, 'MIMEMultipart', autospec=True)
+        )
 
     @mock.patch.object(email, 'MIMEText')
     def test_html_text_uses_html_type(self, mock_MIMEText):
@@ -38,9 +43,7 @@ class TestSendEmail(unittest.TestCase):
         )
         mock_MIMEText.assert_called_once_with(text, 'plain', 'utf-8')
 
-    @mock.patch.object(email, 'os')
-    def test_raises_exception_when_attachment_file_not_found(self, mock_os):
-        mock_os.path.isfile.return_value = False
+    def test_raises_exception_when_attachment_file_not_found(self):
         with self.assertRaises(FileNotFoundError):
             email.send_email(
                 send_from='you@mars.com',
@@ -114,3 +117,55 @@ class TestSendEmail(unittest.TestCase):
 
 
 
+
+
+class TestMailer(unittest.TestCase):
+    def setUp(self):
+        stack = contextlib.ExitStack()
+        self.addCleanup(stack.close)
+
+        # Mock only the surface send code touches; autospec'ing the whole
+        # smtplib module walks every class signature on each test.
+        self.mock_smtplib = stack.enter_context(
+            mock.patch.object(email, 'smtplib', mock.MagicMock(spec_set=['SMTP']))
+        )
+        self.mock_MIMEMultipart = stack.enter_context(
+            mock.patch.object(email, 'MIMEMultipart', autospec=True)
+        )
+
+        self.mock_smtp = self.mock_smtplib.SMTP.return_value
+
+    def test_connect_opens_and_authenticates_session(self):
+        mailer = email.Mailer(username='user', password='pass')
+        mailer.connect()
+        self.mock_smtplib.SMTP.assert_called_once_with('smtp.gmail.com', 587)
+        self.mock_smtp.starttls.assert_called_once_with()
+        self.mock_smtp.login.assert_called_once_with('user', 'pass')
+
+    def test_connect_without_tls_skips_starttls(self):
+        mailer = email.Mailer(use_tls=False)
+        mailer.connect()
+        self.assertFalse(self.mock_smtp.starttls.called)
+
+    def test_send_reuses_session_across_sends(self):
+        with email.Mailer() as mailer:
+            mailer.send(
+                send_from='you@mars.com',
+                send_to='you@earth.com',
+                subject='welcome to mars',
+                text='<i>hello mars!</i>',
+            )
+            mailer.send(
+                send_from='you@mars.com',
+                send_to='you@earth.com',
+                subject='welcome back',
+                text='<i>hello again!</i>',
+            )
+        self.mock_smtplib.SMTP.assert_called_once_with('smtp.gmail.com', 587)
+        self.assertEqual(self.mock_smtp.sendmail.call_count, 2)
+
+    def test_close_quits_session(self):
+        mailer = email.Mailer()
+        mailer.connect()
+        mailer.close()
+        self.mock_smtp.quit.assert_called_once_with()
@@ -21,3 +21,15 @@ class TestItertuples(unittest.TestCase):
         self.assertEqual(actual, expected)
         self.assertEqual(expected[0].col1, '1')
         self.assertEqual(expected[1].col3, '6')
+
+
+class TestFcopyCsv(unittest.TestCase):
+    def test_copies_rows_verbatim(self):
+        src = io.StringIO(
+            'col1\tcol2\n'
+            '1\t2\n'
+            '3\t4\n'
+        )
+        dest = io.StringIO()
+        csv.fcopy_csv(src, dest)
+        self.assertEqual(dest.getvalue(), 'col1\tcol2\r\n1\t2\r\n3\t4\r\n')
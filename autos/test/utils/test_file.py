@@ -1,9 +1,27 @@
+import os
+import glob
+import tempfile
 import unittest
 import unittest.mock as mock
 
 import autos.utils.file as file
 
 
+class TestMergeFiles(unittest.TestCase):
+    def test_merges_sources_in_sorted_order_and_removes_them(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name, content in [('b.part', b'world'), ('a.part', b'hello ')]:
+                with open(os.path.join(tmpdir, name), 'wb') as fp:
+                    fp.write(content)
+
+            dst = os.path.join(tmpdir, 'merged.txt')
+            file.merge_files(dst, os.path.join(tmpdir, '*.part'))
+
+            with open(dst, 'rb') as fp:
+                self.assertEqual(fp.read(), b'hello world')
+            self.assertEqual(os.listdir(tmpdir), ['merged.txt'])
+
+
 class TestRemoveFile(unittest.TestCase):
     def setUp(self):
         patcher = mock.patch.object(file, 'os', autospec=True)
@@ -32,4 +50,26 @@ class TestRemoveFiles(unittest.TestCase):
         file.remove_files(paths=paths)
         expected_calls = list(map(mock.call, paths))
         actual_calls = self.mock_remove_file.mock_calls
-        self.assertEqual(actual_calls, expected_calls)
+        self.assertCountEqual(actual_calls, expected_calls)
+
+
+class TestIglob(unittest.TestCase):
+    def test_simple_pattern_matches_glob_semantics(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ['a.csv', 'b.csv', 'c.txt', '.hidden.csv']:
+                open(os.path.join(tmpdir, name), 'w').close()
+            pattern = os.path.join(tmpdir, '*.csv')
+            self.assertEqual(sorted(file._iglob(pattern)), sorted(glob.glob(pattern)))
+
+    def test_complex_pattern_falls_back_to_glob(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ['a1.csv', 'a2.csv', 'b1.csv']:
+                open(os.path.join(tmpdir, name), 'w').close()
+            pattern = os.path.join(tmpdir, 'a[12].csv')
+            self.assertEqual(sorted(file._iglob(pattern)), sorted(glob.glob(pattern)))
+
+    def test_yields_nothing_when_directory_is_a_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'somefile.txt')
+            open(path, 'w').close()
+            self.assertEqual(list(file._iglob(os.path.join(path, '*.csv'))), [])
@@ -45,3 +45,14 @@ class TestChunkIterable(unittest.TestCase):
         self.assertEqual(actual, expected)
 
 
+
+class TestChunkIterableReuse(unittest.TestCase):
+    def test_chunks_have_correct_content_when_copied(self):
+        strings = ['three', 'four', 'three', 'moon', 'rose']
+        actual = [list(chunk) for chunk in iterable.chunk_iterable_reuse(strings, 3)]
+        expected = [['three', 'four', 'three'], ['moon', 'rose']]
+        self.assertEqual(actual, expected)
+
+    def test_full_chunks_reuse_the_same_buffer(self):
+        chunks = iterable.chunk_iterable_reuse(range(6), 2)
+        self.assertIs(next(chunks), next(chunks))
@@ -1,7 +1,8 @@
-__all__ = ['fread_csv', 'read_csv', 'fwrite_csv', 'write_csv']
+__all__ = ['fread_csv', 'read_csv', 'fwrite_csv', 'write_csv', 'fcopy_csv', 'copy_csv']
 
 
 import csv
+import functools
 import collections
 
 import autos.constants as constants
@@ -11,6 +12,11 @@ def iterlists(fp, **kwargs):
     yield from csv.reader(fp, **kwargs)
 
 
+@functools.lru_cache(maxsize=128)
+def _row_cls(header):
+    return collections.namedtuple('Row', header)
+
+
 def itertuples(fp, **kwargs):
     '''Iterate over CSV rows and yields namedtuple for each row.
     Fieldnames need to be valid Python identifier except for names starting with underscore.
@@ -28,9 +34,8 @@ def itertuples(fp, **kwargs):
 
     reader = iterlists(fp, **kwargs)
     header = next(reader)
-    Row = collections.namedtuple('Row', header)
-    for row in reader:
-        yield Row(*row)
+    Row = _row_cls(tuple(header))
+    yield from map(Row._make, reader)
 
 
 def iterdicts(fp, **kwargs):
@@ -104,3 +109,45 @@ def write_csv(path, rows, from_dict=False, header=True, **kwargs):
     newline = kwargs.pop('newline', constants.DEFAULT_NEWLINE)
     fp = open(path, mode='w', encoding=encoding, newline=newline)
     fwrite_csv(fp, rows, from_dict=from_dict, header=header, **kwargs)
+
+
+def fcopy_csv(src_fp, dest_fp, **kwargs):
+    '''Copy CSV rows from src_fp to dest_fp in one fused reader-to-writer pass.
+
+    csv.writer.writerows consumes the C reader's row lists directly, so no
+    per-row Python loop or namedtuple/dict materialization happens.
+
+    :type src_fp: file object
+    :param src_fp: File object that points to the source CSV file.
+
+    :type dest_fp: file object
+    :param dest_fp: File object that points to the destination CSV file.
+
+    :type kwargs: keyword arguments
+    :param kwargs: extra arguments to be passed to csv.reader() and csv.writer().
+    '''
+
+    delimiter = kwargs.pop('delimiter', constants.DEFAULT_DELIMITER)
+    reader = csv.reader(src_fp, delimiter=delimiter, **kwargs)
+    writer = csv.writer(dest_fp, delimiter=delimiter, **kwargs)
+    writer.writerows(reader)
+
+
+def copy_csv(src_path, dest_path, **kwargs):
+    '''Copy CSV rows from src_path to dest_path.
+
+    :type src_path: str
+    :param src_path: Source CSV file path.
+
+    :type dest_path: str
+    :param dest_path: Destination CSV file path.
+
+    :type kwargs: keyword arguments
+    :param kwargs: extra arguments to be passed to open() and fcopy_csv().
+    '''
+
+    encoding = kwargs.pop('encoding', constants.DEFAULT_ENCODING)
+    newline = kwargs.pop('newline', constants.DEFAULT_NEWLINE)
+    with open(src_path, encoding=encoding, newline=newline) as src_fp:
+        with open(dest_path, mode='w', encoding=encoding, newline=newline) as dest_fp:
+            fcopy_csv(src_fp, dest_fp, **kwargs)
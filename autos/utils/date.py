@@ -3,22 +3,28 @@ __all__ = ['date_range', 'get_past_date', 'parse_date']
 import datetime
 
 
-def date_range(since=datetime.date.today(), until=datetime.date.today()):
+def date_range(since=None, until=None):
     """Get date range from `since` until `until`.
 
     :type since: datetime.date
-    :param since: Earliest date of the range.
+    :param since: Earliest date of the range. Defaults to today's date.
 
     :type until: datetime.date
-    :param until: Latest date of the range.
+    :param until: Latest date of the range. Defaults to today's date.
 
     :rtype: iterable
     :returns: iterable of datetime.date instances for each date within the range.
     """
 
-    while since <= until:
-        yield until
-        until -= datetime.timedelta(days=1)
+    today = datetime.date.today()
+    if since is None:
+        since = today
+    if until is None:
+        until = today
+
+    fromordinal = datetime.date.fromordinal
+    for ordinal in range(until.toordinal(), since.toordinal() - 1, -1):
+        yield fromordinal(ordinal)
 
 
 def get_past_date(days=0, weeks=0):
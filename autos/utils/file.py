@@ -3,6 +3,7 @@ __all__ = ['remove_file', 'remove_files', 'zip_files']
 import os
 import glob
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import zlib
@@ -12,6 +13,45 @@ else:
     DEFAULT_ZIP_MODE = zipfile.ZIP_DEFLATED
 
 
+def _iglob(pattern):
+    """glob.iglob, with an os.scandir fast path for plain patterns.
+
+    For 'dir/prefix*suffix' patterns — the common case here — entries are
+    matched with two string comparisons instead of running fnmatch on
+    every name in the directory. Anything fancier falls back to glob.
+    """
+
+    dirname, basename = os.path.split(pattern)
+    if (
+        glob.has_magic(dirname)
+        or basename.count('*') != 1
+        or any(char in basename for char in '?[')
+    ):
+        return glob.iglob(pattern)
+
+    prefix, suffix = basename.split('*')
+    min_length = len(prefix) + len(suffix)
+
+    def scan():
+        try:
+            entries = os.scandir(dirname or '.')
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.') and not prefix.startswith('.'):
+                    continue
+                if (
+                    len(name) >= min_length
+                    and name.startswith(prefix)
+                    and name.endswith(suffix)
+                ):
+                    yield os.path.join(dirname, name)
+
+    return scan()
+
+
 def merge_files(dst, src_glob, nbytes=1 << 30):
     """Merge src files to dst. Only works on Linux.
 
@@ -25,15 +65,33 @@ def merge_files(dst, src_glob, nbytes=1 << 30):
     :param nbytes: Number of bytes sent per iteration.
     """
 
-    paths = sorted(glob.iglob(src_glob))
+    paths = sorted(_iglob(src_glob))
     if paths:
         OVERWRITE_FLAGS = os.O_WRONLY|os.O_CREAT|os.O_TRUNC
         dest_fd = os.open(dst, flags=OVERWRITE_FLAGS, mode=0o666)
-        for path in paths:
-            src_fd = os.open(path, os.O_RDONLY)
-            while os.sendfile(dest_fd, src_fd, offset=None, count=nbytes) != 0:
-                pass
-            os.remove(path)
+        try:
+            for path in paths:
+                src_fd = os.open(path, os.O_RDONLY)
+                try:
+                    size = os.fstat(src_fd).st_size
+                    # Tell the kernel the source is read once, front to back,
+                    # so readahead ramps up and the pages are dropped instead
+                    # of crowding out the rest of the page cache.
+                    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(dest_fd, src_fd, offset, min(nbytes, size - offset))
+                        if sent == 0:
+                            # Source shrank after the fstat; stop at the
+                            # short copy instead of spinning on EOF.
+                            break
+                        offset += sent
+                    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                finally:
+                    os.close(src_fd)
+                os.remove(path)
+        finally:
+            os.close(dest_fd)
 
 
 def remove_file(path):
@@ -43,19 +101,69 @@ def remove_file(path):
         pass
 
 
-def remove_files(glob_pattern='', paths=()):
+def remove_files(glob_pattern='', paths=(), max_workers=None):
+    """Remove files concurrently.
+
+    Each os.remove is a GIL-releasing syscall, so deleting many small
+    files overlaps well in a thread pool.
+
+    :type glob_pattern: str
+    :param glob_pattern: Glob pattern of files to remove. Takes precedence over paths.
+
+    :type paths: iterable
+    :param paths: Paths of files to remove.
+
+    :type max_workers: int
+    :param max_workers: Number of worker threads. Defaults to a size
+                        proportional to the CPU count.
+    """
+
     if glob_pattern:
-        paths = glob.iglob(glob_pattern)
+        paths = _iglob(glob_pattern)
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # consume the iterator so worker exceptions propagate
+        for _ in executor.map(remove_file, paths):
+            pass
+
+
+PRECOMPRESSED_EXTENSIONS = frozenset({
+    '.7z', '.bz2', '.gif', '.gz', '.jpeg', '.jpg', '.mp4', '.parquet',
+    '.png', '.xz', '.zip', '.zst',
+})
+
 
-    for path in paths:
-        remove_file(path)
+def zip_files(dest, glob_pattern='', paths=(), mode='w', compression=DEFAULT_ZIP_MODE, compresslevel=1):
+    """Zip files into dest.
 
+    Defaults to fast deflate (level 1); bundling is usually I/O-bound and
+    higher levels cost much more CPU for little size gain. Files whose
+    extension marks them as already compressed are stored as-is, since
+    deflating them again gains nothing.
+
+    :type dest: str
+    :param dest: Destination zip file path.
+
+    :type glob_pattern: str
+    :param glob_pattern: Glob pattern of files to zip. Takes precedence over paths.
+
+    :type paths: iterable
+    :param paths: Paths of files to zip.
+
+    :type compresslevel: int
+    :param compresslevel: zlib compression level, 0-9. Pass None for the
+                          zlib default (6).
+    """
 
-def zip_files(dest, glob_pattern='', paths=(), mode='w', compression=DEFAULT_ZIP_MODE):
     if glob_pattern:
-        paths = glob.iglob(glob_pattern)
+        paths = _iglob(glob_pattern)
 
-    with zipfile.ZipFile(dest, mode=mode, compression=compression) as zipper:
+    with zipfile.ZipFile(dest, mode=mode, compression=compression, compresslevel=compresslevel) as zipper:
         for path in paths:
             filename = os.path.split(path)[1]
-            zipper.write(path, arcname=filename)
+            ext = os.path.splitext(filename)[1].lower()
+            compress_type = zipfile.ZIP_STORED if ext in PRECOMPRESSED_EXTENSIONS else None
+            zipper.write(path, arcname=filename, compress_type=compress_type)
@@ -1,24 +1,74 @@
 import glob
 import ftplib
 import os.path
+from concurrent.futures import ThreadPoolExecutor
+
+from autos.utils.iterable import partition
 
 
 class FTP:
     def __init__(self, host, user, password, use_tls=False):
-        if use_tls:
-            self.client = ftplib.FTP_TLS(host, user, password)
-            self.client.prot_p()
+        self.host = host
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.client = self._connect()
+
+    def _connect(self):
+        if self.use_tls:
+            client = ftplib.FTP_TLS(self.host, self.user, self.password)
+            client.prot_p()
         else:
-            self.client = ftplib.FTP(host, user, password)
+            client = ftplib.FTP(self.host, self.user, self.password)
+        return client
+
+    @staticmethod
+    def _upload_all(client, dst_dir, paths):
+        with client:
+            client.cwd(dst_dir)
+            for path in paths:
+                filename = os.path.split(path)[1]
+                with open(path, 'rb') as fp:
+                    client.storbinary('STOR {}'.format(filename), fp)
+
+    def upload(self, dst_dir, glob_pattern='', paths=(), max_workers=1):
+        """Upload files to dst_dir.
+
+        An FTP connection carries one transfer at a time, so with
+        max_workers > 1 the paths are split round-robin over that many
+        connections, each uploading its share from its own thread. All
+        connections are closed when the upload finishes.
+
+        :type dst_dir: str
+        :param dst_dir: Destination directory on the server.
+
+        :type glob_pattern: str
+        :param glob_pattern: Glob pattern of files to upload. Takes precedence over paths.
+
+        :type paths: iterable
+        :param paths: Paths of files to upload.
+
+        :type max_workers: int
+        :param max_workers: Number of concurrent connections.
+        """
 
-    def upload(self, dst_dir, glob_pattern='', paths=()):
         if glob_pattern:
             paths = glob.iglob(glob_pattern)
 
-        if paths:
-            with self.client as client:
-                client.cwd(dst_dir)
-                for path in paths:
-                    filename = os.path.split(path)[1]
-                    with open(path, 'rb') as fp:
-                        client.storbinary('STOR {}'.format(filename), fp)
+        paths = list(paths)
+        if not paths:
+            return
+
+        if max_workers <= 1:
+            self._upload_all(self.client, dst_dir, paths)
+            return
+
+        parts = partition(paths, min(max_workers, len(paths)))
+        clients = [self.client] + [self._connect() for _ in parts[1:]]
+        with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+            futures = [
+                executor.submit(self._upload_all, client, dst_dir, part)
+                for client, part in zip(clients, parts)
+            ]
+            for future in futures:
+                future.result()
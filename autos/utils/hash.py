@@ -1,13 +1,18 @@
 from hashlib import md5
 from hashlib import sha1
+from hashlib import sha256
+
+
+HASHERS = {
+    'md5': md5,
+    'sha1': sha1,
+    'sha256': sha256,
+}
 
 
 def hash_str(string, hash_type='md5'):
-    byte = string.encode('UTF-8')
-    if hash_type == 'md5':
-        hasher = md5
-    elif hash_type == 'sha1':
-        hasher = sha1
-    else:
-        raise ValueError('Unknown hash type: {}'.format(hash_type))
-    return hasher(byte).hexdigest()
+    try:
+        hasher = HASHERS[hash_type]
+    except KeyError:
+        raise ValueError('Unknown hash type: {}'.format(hash_type)) from None
+    return hasher(string.encode('UTF-8')).hexdigest()
@@ -1,4 +1,4 @@
-__all__ = ['dedupe', 'partition', 'chunk_iterable']
+__all__ = ['dedupe', 'partition', 'chunk_iterable', 'chunk_iterable_reuse']
 
 import itertools
 
@@ -17,11 +17,18 @@ def dedupe(items, key=None):
     """
 
     seen = set()
-    for item in items:
-        val = key(item) if key is not None else item
-        if val not in seen:
-            yield item
-            seen.add(val)
+    seen_add = seen.add
+    if key is None:
+        for item in items:
+            if item not in seen:
+                yield item
+                seen_add(item)
+    else:
+        for item in items:
+            val = key(item)
+            if val not in seen:
+                yield item
+                seen_add(val)
 
 
 def partition(iterable, k):
@@ -37,13 +44,11 @@ def partition(iterable, k):
     :returns: List of lists of partitioned iterable.
     """
 
-    partitioned = []
-    for idx, item in zip(itertools.cycle(range(k)), iterable):
-        try:
-            partitioned[idx].append(item)
-        except IndexError:
-            partitioned.append([item])
-    return partitioned
+    partitioned = [[] for _ in range(k)]
+    appends = [part.append for part in partitioned]
+    for append, item in zip(itertools.cycle(appends), iterable):
+        append(item)
+    return [part for part in partitioned if part]
 
 
 def chunk_iterable(iterable, size):
@@ -65,3 +70,36 @@ def chunk_iterable(iterable, size):
         yield chunk
         chunk = tuple(itertools.islice(it, size))
 
+
+
+def chunk_iterable_reuse(iterable, size):
+    """Chunk iterable like chunk_iterable, but reuse one list as the buffer.
+
+    The same list object is yielded for every full chunk (the final
+    partial chunk is a fresh, shorter list), which cuts one allocation
+    per chunk. Callers must therefore consume or copy each chunk before
+    advancing the iterator.
+
+    :type iterable: iterable
+    :param iterable: Iterable to be chunked.
+
+    :type size: int
+    :param size: Number of elements per chunk.
+
+    :rtype: iterator
+    :returns: Lists of up to size elements.
+    """
+
+    it = iter(iterable)
+    buffer = [None] * size
+    while True:
+        n = 0
+        for item in itertools.islice(it, size):
+            buffer[n] = item
+            n += 1
+        if n == size:
+            yield buffer
+        else:
+            if n:
+                yield buffer[:n]
+            return
@@ -1,6 +1,7 @@
 __all__ = ['dround']
 
 import decimal
+import functools
 
 
 def dround(decimal_number, decimal_places):
@@ -16,4 +17,9 @@ def dround(decimal_number, decimal_places):
     :returns: Rounded decimal number.
     """
 
-    return decimal_number.quantize(decimal.Decimal(10) ** -decimal_places)
+    return decimal_number.quantize(_exponent(decimal_places))
+
+
+@functools.lru_cache(maxsize=128)
+def _exponent(decimal_places):
+    return decimal.Decimal(10) ** -decimal_places
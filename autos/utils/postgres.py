@@ -11,4 +11,4 @@ def value_placeholder(n_values):
     :returns: Value placeholder.
     """
 
-    return '({})'.format(','.join(["'{}'"] * n_values))
+    return '({})'.format(','.join(("'{}'",) * n_values))
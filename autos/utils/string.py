@@ -3,6 +3,13 @@ __all__ = ['titlecase']
 import re
 
 
+_WORD_RE = re.compile(r"[A-Za-z]+('[A-Za-z]+)?")
+
+
+def _capitalize_word(mo):
+    return mo.group(0).capitalize()
+
+
 def titlecase(string):
     """Turn string of words into titlecased words.
 
@@ -10,8 +17,4 @@ def titlecase(string):
     :param string: A string of words.
     """
 
-    return re.sub(
-        r"[A-Za-z]+('[A-Za-z]+)?",
-        lambda mo: mo.group(0)[0].upper() + mo.group(0)[1:].lower(),
-        string,
-    )
+    return _WORD_RE.sub(_capitalize_word, string)